@@ -0,0 +1,7 @@
+-- Index vehicle_data on timestamp for the dashboard's time-range queries.
+-- Rows are appended in timestamp order, so a BRIN index stays tiny while
+-- still letting the dashboard's "last hour" filters skip old blocks.
+-- CONCURRENTLY cannot run inside a transaction block; run with autocommit:
+--   psql "$URL" -f migrations/001_vehicle_data_timestamp_index.sql
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_vehicle_data_timestamp
+    ON vehicle_data USING BRIN (timestamp);
@@ -0,0 +1,15 @@
+-- Tell listening dashboards that vehicle_data received new rows.
+-- The dashboard LISTENs on vehicle_update and only re-queries after a
+-- notification. One notification per INSERT statement is enough, the
+-- dashboard fetches every row newer than the last one it holds.
+CREATE OR REPLACE FUNCTION notify_vehicle_update() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('vehicle_update', '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS t_notify ON vehicle_data;
+CREATE TRIGGER t_notify
+    AFTER INSERT ON vehicle_data
+    FOR EACH STATEMENT EXECUTE FUNCTION notify_vehicle_update();